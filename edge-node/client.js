@@ -48,6 +48,8 @@ async function sendTelemetry(client, n = 10, hz = 5) {
       alt_m: 120.0 + i * 0.5,
       yaw_deg: 10.0, pitch_deg: 0.5, roll_deg: 0.2,
       vn: 0.0, ve: 0.0, vd: 0.0,
+      sent_unix_ns: (BigInt(Date.now()) * 1000000n).toString(),
+      seq: i,
     });
     await sleep(periodMs);
   }
@@ -77,6 +79,8 @@ async function sendDetections(client, n = 5, hz = 2) {
       confidence: 0.8 + Math.random() * 0.2,
       bbox: { x: 100 + i * 5, y: 150 + i * 3, w: 60, h: 40 },
       lat: 32.70, lon: -117.16,
+      sent_unix_ns: (BigInt(Date.now()) * 1000000n).toString(),
+      seq: i,
     });
     await sleep(periodMs);
   }
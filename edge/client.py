@@ -64,6 +64,7 @@ async def send_telemetry(stub: telemetry_pb2_grpc.TelemetryIngestStub, n=10, hz=
                 alt_m=120.0 + i * 0.5,
                 yaw_deg=10.0, pitch_deg=0.5, roll_deg=0.2,
                 vn=0.0, ve=0.0, vd=0.0,
+                sent_unix_ns=time.time_ns(), seq=i,
             )
             await asyncio.sleep(period)
     ack = await stub.StreamTelemetry(gen())
@@ -80,6 +81,7 @@ async def send_detections(stub: detections_pb2_grpc.DetectionIngestStub, n=5, hz
                 cls="target", confidence=min(1.0, 0.8 + 0.05 * i),
                 bbox=detections_pb2.BBox(x=100 + 5 * i, y=150 + 3 * i, w=60, h=40),
                 lat=32.70, lon=-117.16,
+                sent_unix_ns=time.time_ns(), seq=i,
             )
             await asyncio.sleep(period)
     ack = await stub.StreamDetections(gen())
@@ -0,0 +1,112 @@
+# ground/latency.py
+# Rolling per-stream latency stats: edge send -> ground receive -> serialize -> queue -> persist
+from __future__ import annotations
+import os, math, threading
+from collections import deque
+from typing import Deque, Dict, Optional
+
+# Stages tracked per message (all in nanoseconds, wall clock):
+#   net       = recv - sent        (edge -> ground, includes clock offset between hosts)
+#   serialize = ser - recv         (protobuf -> dict)
+#   queue     = deq - ser          (wait in the recorder sink queue)
+#   persist   = persist - deq      (hand-off to writer thread + recorder write + flush)
+#   e2e       = persist - sent     (edge timestamp -> durable write, includes all of the above)
+STAGES = ("net", "serialize", "queue", "persist", "e2e")
+
+PERCENTILES = (50, 95, 99)
+
+
+def _percentile(sorted_vals: list, pct: float) -> float:
+    # nearest-rank percentile on an already sorted list
+    if not sorted_vals:
+        return 0.0
+    k = max(0, min(len(sorted_vals) - 1, math.ceil(pct / 100.0 * len(sorted_vals)) - 1))
+    return sorted_vals[k]
+
+
+class _StreamStats:
+    def __init__(self, window: int):
+        self.samples: Dict[str, Deque[int]] = {s: deque(maxlen=window) for s in STAGES}
+        self.count = 0
+        self.gaps = 0          # missing seq numbers (lost/reordered messages)
+
+
+class SeqGapCounter:
+    """
+    Tracks `seq` for a single RPC call. Edges number messages per call, so one
+    counter per request_iterator keeps concurrent edges, replays and restarts
+    from producing false gaps.
+    """
+
+    def __init__(self):
+        self.last_seq: Optional[int] = None
+
+    # Number of seq values skipped since the previous message on this call
+    def update(self, seq: int) -> int:
+        gaps = 0
+        if self.last_seq is not None and seq > self.last_seq + 1:
+            gaps = seq - self.last_seq - 1
+        self.last_seq = seq
+        return gaps
+
+
+class LatencyTracker:
+    """
+    Keeps the last `window` samples per stream and stage and reports p50/p95/p99 in ms.
+    Messages without an edge send timestamp (sent_ns == 0) only contribute
+    serialize/queue/persist samples; without a dequeue time (deq_ns == 0)
+    the queue wait is folded into persist.
+    """
+
+    def __init__(self, window: Optional[int] = None):
+        if window is None:
+            window = int(os.getenv("LATENCY_WINDOW", "1024"))
+        self.window = window
+        self._streams: Dict[str, _StreamStats] = {}
+        self._lock = threading.Lock()
+
+    # Record one message's timestamps for the given stream
+    def observe(self, stream: str, *, sent_ns: int, recv_ns: int, ser_ns: int,
+                persist_ns: int, deq_ns: int = 0, gaps: int = 0) -> None:
+        with self._lock:
+            st = self._streams.get(stream)
+            if st is None:
+                st = self._streams[stream] = _StreamStats(self.window)
+            st.count += 1
+            st.samples["serialize"].append(ser_ns - recv_ns)
+            if deq_ns:
+                st.samples["queue"].append(deq_ns - ser_ns)
+                st.samples["persist"].append(persist_ns - deq_ns)
+            else:
+                st.samples["persist"].append(persist_ns - ser_ns)
+            if sent_ns:
+                st.samples["net"].append(recv_ns - sent_ns)
+                st.samples["e2e"].append(persist_ns - sent_ns)
+            st.gaps += gaps
+
+    # p50/p95/p99 (ms) plus sample count for one stream and stage
+    def percentiles(self, stream: str, stage: str = "e2e") -> Dict[str, float]:
+        with self._lock:
+            st = self._streams.get(stream)
+            vals = sorted(st.samples[stage]) if st else []
+        out = {f"p{p}": _percentile(vals, p) / 1e6 for p in PERCENTILES}
+        out["n"] = len(vals)
+        return out
+
+    # All stages for all streams: {stream: {stage: {p50, p95, p99, n}}}
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        with self._lock:
+            names = list(self._streams)
+        return {name: {stage: self.percentiles(name, stage) for stage in STAGES} for name in names}
+
+    # One-line summary suitable for the server log
+    def summary(self, stream: str) -> str:
+        with self._lock:
+            st = self._streams.get(stream)
+            count, gaps = (st.count, st.gaps) if st else (0, 0)
+        parts = [f"n={count}", f"gaps={gaps}"]
+        for stage in STAGES:
+            p = self.percentiles(stream, stage)
+            if p["n"]:
+                parts.append(f"{stage}(ms) p50={p['p50']:.2f} p95={p['p95']:.2f} p99={p['p99']:.2f}")
+        return " ".join(parts)
@@ -0,0 +1,160 @@
+# ground/replay.py
+# Replays a recorded mission (missions/<id>/*.jsonl) back through gRPC at 1x, Nx or max speed
+from __future__ import annotations
+
+import os
+import sys
+import json
+import time
+import heapq
+import asyncio
+import pathlib
+import argparse
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
+from google.protobuf.json_format import ParseDict, ParseError
+
+# Ensure repo root on sys.path so package imports work in both "python -m" and direct execution
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# Make generated stubs importable (expects stubs in gen/python/)
+sys.path.insert(0, str(ROOT / "gen" / "python"))
+
+import telemetry_pb2, telemetry_pb2_grpc
+import detections_pb2, detections_pb2_grpc
+
+from edge.client import make_channel
+
+# stream name -> protobuf message type (matches JsonlRecorder stream names)
+STREAMS = {
+    "telemetry": telemetry_pb2.Telemetry,
+    "detections": detections_pb2.Detection,
+}
+
+# (ts_ns, line_no, stream, protobuf message)
+Event = Tuple[int, int, str, Any]
+
+_EOF = object()
+
+# ---------------------------- readers ----------------------------
+
+def iter_jsonl(path: pathlib.Path, stream: str) -> Iterator[Event]:
+    """
+    Lazily yield (ts_ns, line_no, stream, msg) from a JSONL file, one line at a time.
+    Lines are converted to the stream's protobuf type here, so blank, malformed
+    or wrong-typed lines are skipped; a missing file yields nothing.
+    """
+    msg_type = STREAMS[stream]
+    if not path.is_file():
+        return
+    with path.open("r", encoding="utf-8") as fh:
+        for line_no, line in enumerate(fh, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                obj = json.loads(line)
+                ts = int(obj.get("ts_ns", 0))  # MessageToDict writes int64 as string
+                msg = ParseDict(obj, msg_type(), ignore_unknown_fields=True)
+            except (ValueError, TypeError, AttributeError, ParseError) as e:
+                print(f"[replay] skip {path.name}:{line_no} ({e})")
+                continue
+            yield ts, line_no, stream, msg
+
+
+def merged_events(mission_dir: pathlib.Path) -> Iterator[Event]:
+    """
+    Merge all mission streams into one timeline ordered by ts_ns.
+    heapq.merge keeps only one pending line per file in memory.
+    """
+    readers = [iter_jsonl(mission_dir / f"{name}.jsonl", name) for name in STREAMS]
+    return heapq.merge(*readers, key=lambda ev: (ev[0], ev[1]))
+
+# ---------------------------- replay -----------------------------
+
+async def _drain(q: asyncio.Queue) -> AsyncIterator[Any]:
+    # Request iterator for one client-streaming RPC, fed by the pump
+    while True:
+        msg = await q.get()
+        if msg is _EOF:
+            return
+        # re-stamp so ground latency reflects this replay, not the original mission
+        msg.sent_unix_ns = time.time_ns()
+        yield msg
+
+
+async def _pump(mission_dir: pathlib.Path, queues: Dict[str, asyncio.Queue], speed: float) -> int:
+    """
+    Walk the merged timeline and hand each record to its stream queue,
+    sleeping so that relative ts_ns spacing is preserved (scaled by speed).
+    speed <= 0 means as fast as possible.
+    """
+    loop = asyncio.get_running_loop()
+    t0_wall: Optional[float] = None
+    t0_ts = 0
+    count = 0
+    try:
+        for ts, _, stream, msg in merged_events(mission_dir):
+            if speed > 0:
+                if t0_wall is None:
+                    t0_wall, t0_ts = loop.time(), ts
+                delay = t0_wall + (ts - t0_ts) / 1e9 / speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            await queues[stream].put(msg)
+            count += 1
+    finally:
+        for q in queues.values():
+            await q.put(_EOF)
+    return count
+
+
+async def replay(mission_dir: pathlib.Path, addr: str = "127.0.0.1:50051", speed: float = 1.0) -> int:
+    """
+    Stream a recorded mission to TelemetryIngest/DetectionIngest at `addr`.
+    Returns the number of records sent. TLS/CERT_DIR behave as in edge/client.py.
+    """
+    if not mission_dir.is_dir():
+        raise FileNotFoundError(f"mission dir not found: {mission_dir}")
+
+    # bounded so the reader never runs far ahead of the RPC streams
+    queues: Dict[str, asyncio.Queue] = {name: asyncio.Queue(maxsize=256) for name in STREAMS}
+
+    ch = make_channel(addr)
+    try:
+        tel = telemetry_pb2_grpc.TelemetryIngestStub(ch)
+        det = detections_pb2_grpc.DetectionIngestStub(ch)
+        print(f"[replay] {mission_dir} -> {addr} speed={'max' if speed <= 0 else f'{speed:g}x'}")
+        count, tel_ack, det_ack = await asyncio.gather(
+            _pump(mission_dir, queues, speed),
+            tel.StreamTelemetry(_drain(queues["telemetry"])),
+            det.StreamDetections(_drain(queues["detections"])),
+        )
+        print(f"[replay] sent={count} telemetry ack={tel_ack.ok} detections ack={det_ack.ok}")
+        return count
+    finally:
+        await ch.close()
+
+# ----------------------------- main ------------------------------
+
+def _parse_speed(s: str) -> float:
+    # "max" (or 0) disables pacing; "4" / "4x" replays at 4x
+    s = s.strip().lower()
+    if s in {"max", "0"}:
+        return 0.0
+    return float(s.rstrip("x"))
+
+
+def main(argv: Optional[list] = None) -> None:
+    ap = argparse.ArgumentParser(description="Replay a recorded mission through gRPC")
+    ap.add_argument("mission_dir", type=pathlib.Path, help="e.g. missions/mission-20250925-161604")
+    ap.add_argument("--addr", default=os.getenv("ADDR", "127.0.0.1:50051"))
+    ap.add_argument("--speed", type=_parse_speed, default=_parse_speed(os.getenv("REPLAY_SPEED", "1")),
+                    help="1, 4x, ... or 'max' (default: REPLAY_SPEED or 1)")
+    args = ap.parse_args(argv)
+    asyncio.run(replay(args.mission_dir, args.addr, args.speed))
+
+
+if __name__ == "__main__":
+    main()
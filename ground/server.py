@@ -27,6 +27,8 @@ import telemetry_pb2, telemetry_pb2_grpc
 import detections_pb2, detections_pb2_grpc
 
 from ground.recorder import JsonlRecorder
+from ground.latency import LatencyTracker, SeqGapCounter
+from ground.sinks import SinkRegistry, SinkRegistryClosed, Record, RecorderSink, TcpFeedSink
 
 # ---------------------------- helpers ----------------------------
 
@@ -60,6 +62,28 @@ def _resolve_addr(host: str | None = None, port: int | None = None,
     return h, p
 
 
+def _parse_hostport(value: str, default_host: str, default_port: int) -> Tuple[str, int]:
+    """
+    Tolerant 'host:port' parser: accepts 'host', 'host:port', ':port',
+    '[v6]:port', '[v6]' and bare IPv6. A bad port falls back to the default.
+    """
+    h, p = default_host, default_port
+    value = value.strip()
+    if value.startswith("["):
+        host, _, rest = value[1:].partition("]")
+        port = rest[1:] if rest.startswith(":") else ""
+    elif value.count(":") == 1:
+        host, port = value.split(":", 1)
+    else:
+        host, port = value, ""      # plain host or bare IPv6
+    if host:
+        h = host
+    if port:
+        try: p = int(port)
+        except ValueError: print(f"[ground] ignoring bad port in {value!r}; using {default_port}")
+    return h, p
+
+
 def _load_bytes(path: pathlib.Path, label: str) -> bytes:
     b = path.read_bytes()
     print(f"[tls] loaded {label} {path} bytes={len(b)} sha256={hashlib.sha256(b).hexdigest()[:16]}")
@@ -96,41 +120,56 @@ def _server_credentials(cert_dir: pathlib.Path, require_client_auth: bool = True
 
 # TelemetryIngest service implementation
 class TelemetryIngestService(telemetry_pb2_grpc.TelemetryIngestServicer):
-    def __init__(self, recorder: JsonlRecorder):
-        self.recorder = recorder
+    def __init__(self, sinks: SinkRegistry):
+        self.sinks = sinks
 
     async def StreamTelemetry(self, request_iterator, context):
         """
-        Receives a stream of Telemetry messages, logs a summary line,
-        and persists each one as a JSON object to missions/<id>/telemetry.jsonl.
+        Receives a stream of Telemetry messages, logs a summary line, decodes
+        each one once and publishes it to the registered sinks (recorder,
+        live feed, ...). Latency is observed by the recorder sink on persist.
         """
         count = 0
+        seqs = SeqGapCounter()  # seq is numbered per call, so track gaps per call
         async for msg in request_iterator:
+            recv_ns = time.time_ns()
             count += 1
-            print(f"[telemetry] #{count} lat={msg.lat:.5f} lon={msg.lon:.5f} alt={msg.alt_m:.1f} ts={msg.ts_ns}")
             # Convert protobuf -> dict for JSON serialization
             obj = MessageToDict(msg, preserving_proto_field_name=True)
-            self.recorder.write("telemetry", obj)
+            try:
+                await self.sinks.publish(Record("telemetry", obj, sent_ns=msg.sent_unix_ns, recv_ns=recv_ns,
+                                          ser_ns=time.time_ns(), gaps=seqs.update(msg.seq)))
+            except SinkRegistryClosed:
+                # never ack records the recorder will not persist
+                await context.abort(grpc.StatusCode.UNAVAILABLE, "ground shutting down")
+            # log after stamping so console/pipe writes don't count as serialize time
+            print(f"[telemetry] #{count} lat={msg.lat:.5f} lon={msg.lon:.5f} alt={msg.alt_m:.1f} ts={msg.ts_ns}")
         print(f"[telemetry] stream closed, total={count}")
         return telemetry_pb2.TelemetryAck(ok=True)  
 
 # DetectionIngest service implementation
 class DetectionIngestService(detections_pb2_grpc.DetectionIngestServicer):
-    def __init__(self, recorder: JsonlRecorder):
-        self.recorder = recorder
+    def __init__(self, sinks: SinkRegistry):
+        self.sinks = sinks
 
     async def StreamDetections(self, request_iterator, context):
         """
-        Receives a stream of Detection messages and writes them to missions/<id>/detections.jsonl.
+        Receives a stream of Detection messages and publishes them to the registered sinks.
         """
         count = 0
+        seqs = SeqGapCounter()
         async for d in request_iterator:
+            recv_ns = time.time_ns()
             count += 1
+            obj = MessageToDict(d, preserving_proto_field_name=True)
+            try:
+                await self.sinks.publish(Record("detections", obj, sent_ns=d.sent_unix_ns, recv_ns=recv_ns,
+                                          ser_ns=time.time_ns(), gaps=seqs.update(d.seq)))
+            except SinkRegistryClosed:
+                await context.abort(grpc.StatusCode.UNAVAILABLE, "ground shutting down")
             bb = d.bbox
             print(f"[detection] #{count} {d.cls} conf={d.confidence:.2f} "
                   f"bbox=({bb.x:.1f},{bb.y:.1f},{bb.w:.1f},{bb.h:.1f}) ts={d.ts_ns}")
-            obj = MessageToDict(d, preserving_proto_field_name=True)
-            self.recorder.write("detections", obj)
         print(f"[detection] stream closed, total={count}")
         return detections_pb2.DetectionAck(ok=True)
 
@@ -161,6 +200,24 @@ async def serve(host: str = "127.0.0.1", port: int = 50051):
         mdm_api_key=mdm_api_key,
     )
 
+    # Per-stream latency stats (LATENCY=0 disables)
+    latency = LatencyTracker() if os.getenv("LATENCY", "1") != "0" else None
+
+    # Fan-out: every message is decoded once and queued to each sink independently
+    sinks = SinkRegistry()
+    sinks.register(RecorderSink(recorder, latency))
+    live_addr = os.getenv("LIVE_FEED_ADDR")                # e.g. 127.0.0.1:50070
+    if live_addr:
+        # optional sink: a bad address or busy port must not stop ingest
+        lh, lp = _parse_hostport(live_addr, "127.0.0.1", 50070)
+        feed = TcpFeedSink(lh, lp)
+        try:
+            await feed.start()
+            sinks.register(feed)
+        except OSError as e:
+            print(f"[live-feed] disabled, cannot listen on {lh}:{lp}: {e}")
+    sinks.start()
+
     # Create gRPC server
     options = [
         ("grpc.max_receive_message_length", 20 * 1024 * 1024),
@@ -169,8 +226,8 @@ async def serve(host: str = "127.0.0.1", port: int = 50051):
     server = grpc.aio.server(options=options)
 
     # Register services
-    telemetry_pb2_grpc.add_TelemetryIngestServicer_to_server(TelemetryIngestService(recorder), server)
-    detections_pb2_grpc.add_DetectionIngestServicer_to_server(DetectionIngestService(recorder), server)
+    telemetry_pb2_grpc.add_TelemetryIngestServicer_to_server(TelemetryIngestService(sinks), server)
+    detections_pb2_grpc.add_DetectionIngestServicer_to_server(DetectionIngestService(sinks), server)
 
     addr = f"{host}:{port}"
     if tls_on:
@@ -192,10 +249,21 @@ async def serve(host: str = "127.0.0.1", port: int = 50051):
         print("[ground] server started")
         await server.wait_for_termination()
     finally:
+        # Stop accepting/serving streams first so nothing publishes while the sinks drain
+        grace = float(os.getenv("SHUTDOWN_GRACE_S", "5"))
+        try:
+            await server.stop(grace=grace)
+        except Exception as e:
+            print(f"[ground] stop error: {e}")
         try:
-            recorder.close()  # triggers MDM POSTs per file if enabled
+            await sinks.close()  # drains queues; recorder sink triggers MDM POSTs per file if enabled
         except Exception as e:
-            print(f"[recorder] close error: {e}")
+            print(f"[sinks] close error: {e}")
+        print(f"[sinks] {sinks.stats()}")
+        # server stopped + queues drained, so every acked record is persisted and counted
+        if latency:
+            for stream in latency.snapshot():
+                print(f"[latency] {stream} {latency.summary(stream)}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,223 @@
+# ground/sinks.py
+# Sink fan-out: each ingested message is decoded once and handed to N registered sinks
+from __future__ import annotations
+import os, json, time, asyncio, logging
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, NamedTuple, Optional, Set
+
+from ground.recorder import JsonlRecorder
+from ground.latency import LatencyTracker
+
+log = logging.getLogger(__name__)
+
+
+class Record(NamedTuple):
+    """One decoded message, shared read-only by every sink."""
+    stream: str              # "telemetry" | "detections" (JsonlRecorder stream name)
+    obj: Dict[str, Any]      # MessageToDict output
+    sent_ns: int = 0         # edge wall-clock send time (0 if not stamped)
+    recv_ns: int = 0         # ground receive time
+    ser_ns: int = 0          # after protobuf -> dict
+    deq_ns: int = 0          # taken off this sink's queue (set per sink by the worker)
+    gaps: int = 0            # seq numbers skipped on this RPC call before this message
+
+
+class Sink(ABC):
+    """
+    Base class for consumers. Subclasses override handle(); blocking work
+    (file I/O etc.) should be pushed off the event loop with asyncio.to_thread.
+    Lossy sinks (the default) shed records when their queue is full; lossless
+    sinks make publish() wait instead, back-pressuring the ingest stream.
+    """
+    name = "sink"
+    lossless = False
+
+    @abstractmethod
+    async def handle(self, rec: Record) -> None:
+        ...
+
+    async def close(self) -> None:
+        pass
+
+
+_STOP = object()
+
+
+class SinkRegistryClosed(RuntimeError):
+    """Raised by publish() once the registry is closing; the record was not queued."""
+
+
+class _Slot:
+    # Per-sink queue + worker + counters
+    def __init__(self, sink: Sink, maxsize: int):
+        self.sink = sink
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.task: Optional[asyncio.Task] = None
+        self.handled = 0
+        self.dropped = 0
+        self.errors = 0
+
+
+class SinkRegistry:
+    """
+    Fans each Record out to every registered sink. Every sink has its own
+    bounded queue and worker task. A slow lossy sink drops its own records
+    (counted in stats()) without stalling ingest or the other sinks; a full
+    lossless sink (e.g. the recorder) makes publish() wait for room, which
+    slows the RPC stream through gRPC flow control rather than losing data.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None):
+        if maxsize is None:
+            maxsize = int(os.getenv("SINK_QUEUE_MAX", "1024"))
+        self.maxsize = maxsize
+        self._slots: List[_Slot] = []
+        self._started = False
+        self._closing = False
+
+    # Register a sink (optionally with its own queue size); start() must follow
+    def register(self, sink: Sink, maxsize: Optional[int] = None) -> Sink:
+        slot = _Slot(sink, maxsize or self.maxsize)
+        self._slots.append(slot)
+        if self._started:
+            slot.task = asyncio.get_running_loop().create_task(self._worker(slot))
+        log.debug("[sinks] registered %s (queue=%d)", sink.name, slot.queue.maxsize)
+        return sink
+
+    # Spawn one worker per sink on the running loop
+    def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        for slot in self._slots:
+            if slot.task is None:
+                slot.task = loop.create_task(self._worker(slot))
+        self._started = True
+
+    # Fan-out: lossy sinks are fed first without blocking, then lossless sinks wait for room
+    async def publish(self, rec: Record) -> None:
+        # refuse rather than enqueue behind _STOP, where nothing would ever read it
+        if self._closing:
+            raise SinkRegistryClosed("sink registry is closing")
+        lossless = []
+        for slot in self._slots:
+            if slot.sink.lossless:
+                lossless.append(slot)
+                continue
+            try:
+                slot.queue.put_nowait(rec)
+            except asyncio.QueueFull:
+                slot.dropped += 1
+                if slot.dropped == 1 or slot.dropped % 1000 == 0:
+                    log.warning("[sinks] %s queue full; dropped=%d", slot.sink.name, slot.dropped)
+        for slot in lossless:
+            await slot.queue.put(rec)
+
+    async def _worker(self, slot: _Slot) -> None:
+        while True:
+            rec = await slot.queue.get()
+            if rec is _STOP:
+                return
+            try:
+                await slot.sink.handle(rec._replace(deq_ns=time.time_ns()))
+                slot.handled += 1
+            except Exception:
+                slot.errors += 1
+                log.exception("[sinks] %s failed on %s record", slot.sink.name, rec.stream)
+
+    # Refuse new records, drain queued ones, stop workers and close every sink.
+    # Stop the producers (gRPC server) first so nothing is mid-publish.
+    async def close(self) -> None:
+        self._closing = True
+        for slot in self._slots:
+            if slot.task is not None:
+                await slot.queue.put(_STOP)
+        for slot in self._slots:
+            if slot.task is not None:
+                await slot.task
+            try:
+                await slot.sink.close()
+            except Exception:
+                log.exception("[sinks] %s close failed", slot.sink.name)
+        self._started = False
+
+    # {sink name: {handled, dropped, errors, queued}}
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            s.sink.name: {"handled": s.handled, "dropped": s.dropped,
+                          "errors": s.errors, "queued": s.queue.qsize()}
+            for s in self._slots
+        }
+
+# ---------------------------- sinks ------------------------------
+
+class RecorderSink(Sink):
+    """
+    Writes records to JsonlRecorder off the event loop. The write is the
+    durable point, so persist latency is observed here when a tracker is given.
+    Lossless: a full queue back-pressures ingest instead of dropping records.
+    """
+    name = "recorder"
+    lossless = True
+
+    def __init__(self, recorder: JsonlRecorder, latency: Optional[LatencyTracker] = None):
+        self.recorder = recorder
+        self.latency = latency
+
+    def _write(self, rec: Record) -> None:
+        self.recorder.write(rec.stream, rec.obj)
+        if self.latency:
+            self.latency.observe(rec.stream, sent_ns=rec.sent_ns, recv_ns=rec.recv_ns,
+                                 ser_ns=rec.ser_ns, persist_ns=time.time_ns(),
+                                 deq_ns=rec.deq_ns, gaps=rec.gaps)
+
+    async def handle(self, rec: Record) -> None:
+        await asyncio.to_thread(self._write, rec)
+
+    async def close(self) -> None:
+        # triggers MDM POSTs per file if enabled
+        await asyncio.to_thread(self.recorder.close)
+
+
+class TcpFeedSink(Sink):
+    """
+    Live feed for local displays: NDJSON lines {"stream": ..., "data": {...}}
+    broadcast to every TCP client connected to host:port. Clients that can't
+    keep up within `write_timeout` seconds are disconnected.
+    """
+    name = "live-feed"
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 50070, write_timeout: float = 0.5):
+        self.host, self.port = host, port
+        self.write_timeout = write_timeout
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._clients: Set[asyncio.StreamWriter] = set()
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._on_client, self.host, self.port)
+        print(f"[live-feed] listening on {self.host}:{self.port}")
+
+    async def _on_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._clients.add(writer)
+        print(f"[live-feed] client connected {writer.get_extra_info('peername')}")
+
+    async def _send(self, w: asyncio.StreamWriter, line: bytes) -> None:
+        try:
+            w.write(line)
+            await asyncio.wait_for(w.drain(), self.write_timeout)
+        except (OSError, asyncio.TimeoutError):
+            self._clients.discard(w)
+            w.close()
+
+    async def handle(self, rec: Record) -> None:
+        if not self._clients:
+            return
+        line = (json.dumps({"stream": rec.stream, "data": rec.obj}) + "\n").encode("utf-8")
+        await asyncio.gather(*(self._send(w, line) for w in list(self._clients)))
+
+    async def close(self) -> None:
+        for w in list(self._clients):
+            w.close()
+        self._clients.clear()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
@@ -0,0 +1,76 @@
+# scripts/bench_latency.py
+# E2E latency benchmark: in-process Ground server + Edge simulator, asserts p95 budget
+#
+#   python -u scripts/bench_latency.py
+#
+# Env: BENCH_N (messages per stream, default 200), BENCH_HZ (default 50),
+#      LATENCY_BUDGET_MS (default 300), ADDR (default 127.0.0.1:50061)
+import os, sys, asyncio, pathlib, tempfile
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import grpc
+from ground.server import TelemetryIngestService, DetectionIngestService
+from ground.server import telemetry_pb2_grpc, detections_pb2_grpc
+from ground.recorder import JsonlRecorder
+from ground.latency import LatencyTracker
+from ground.sinks import SinkRegistry, RecorderSink
+from edge.client import send_telemetry, send_detections
+
+N = int(os.getenv("BENCH_N", "200"))
+HZ = float(os.getenv("BENCH_HZ", "50"))
+BUDGET_MS = float(os.getenv("LATENCY_BUDGET_MS", "300"))
+ADDR = os.getenv("ADDR", "127.0.0.1:50061")
+
+
+async def run() -> dict:
+    latency = LatencyTracker(window=max(N, 1))
+    with tempfile.TemporaryDirectory() as tmp:
+        recorder = JsonlRecorder(root=pathlib.Path(tmp), ingest_on_close_flag=False)
+        sinks = SinkRegistry()
+        sinks.register(RecorderSink(recorder, latency))
+        sinks.start()
+        server = grpc.aio.server()
+        telemetry_pb2_grpc.add_TelemetryIngestServicer_to_server(TelemetryIngestService(sinks), server)
+        detections_pb2_grpc.add_DetectionIngestServicer_to_server(DetectionIngestService(sinks), server)
+        if server.add_insecure_port(ADDR) == 0:
+            raise RuntimeError(f"Failed to bind {ADDR}")
+        await server.start()
+        try:
+            async with grpc.aio.insecure_channel(ADDR) as ch:
+                await asyncio.gather(
+                    send_telemetry(telemetry_pb2_grpc.TelemetryIngestStub(ch), n=N, hz=HZ),
+                    send_detections(detections_pb2_grpc.DetectionIngestStub(ch), n=N, hz=HZ),
+                )
+        finally:
+            await server.stop(grace=None)
+            await sinks.close()  # drain recorder queue so every message is persisted
+        print(f"[bench] sinks {sinks.stats()}")
+    return latency.snapshot()
+
+
+def main() -> int:
+    snap = asyncio.run(run())
+    failed = False
+    print(f"\n[bench] N={N} HZ={HZ:g} budget p95<={BUDGET_MS:g}ms")
+    for stream, stages in snap.items():
+        for stage, p in stages.items():
+            print(f"[bench] {stream:<10} {stage:<9} n={p['n']:<5} p50={p['p50']:.2f} p95={p['p95']:.2f} p99={p['p99']:.2f} ms")
+        e2e = stages["e2e"]
+        if e2e["n"] < N:
+            print(f"[bench] FAIL {stream}: only {e2e['n']}/{N} samples")
+            failed = True
+        elif e2e["p95"] > BUDGET_MS:
+            print(f"[bench] FAIL {stream}: e2e p95={e2e['p95']:.2f}ms > {BUDGET_MS:g}ms")
+            failed = True
+    if not snap:
+        print("[bench] FAIL: no samples recorded")
+        failed = True
+    print("[bench] FAIL" if failed else "[bench] PASS")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())